@@ -1,5 +1,5 @@
 """Risk rating evaluation package."""
 
-from .analyzer import RiskRatingEvaluator, load_rules
+from .analyzer import CompiledRules, RiskRatingEvaluator, compile_rules, load_rules, normalize_chunks
 
-__all__ = ["RiskRatingEvaluator", "load_rules"]
+__all__ = ["CompiledRules", "RiskRatingEvaluator", "compile_rules", "load_rules", "normalize_chunks"]
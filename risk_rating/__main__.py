@@ -4,7 +4,9 @@ import argparse
 import json
 from pathlib import Path
 
-from .analyzer import RiskRatingEvaluator, load_rules
+from .analyzer import RiskRatingEvaluator, load_rules, normalize_chunks
+
+NOTES_CHUNK_SIZE = 64 * 1024
 
 
 def parse_args() -> argparse.Namespace:
@@ -25,10 +27,12 @@ def parse_args() -> argparse.Namespace:
 
 
 def load_notes(notes_arg: str) -> str:
+    """Return the normalized notes from a file path or from the raw argument text."""
     path = Path(notes_arg)
     if path.exists():
-        return path.read_text(encoding="utf-8")
-    return notes_arg
+        with path.open("r", encoding="utf-8") as f:
+            return normalize_chunks(iter(lambda: f.read(NOTES_CHUNK_SIZE), ""))
+    return normalize_chunks((notes_arg,))
 
 
 def main() -> None:
@@ -40,7 +44,7 @@ def main() -> None:
         rules_path = default_rules
     rules = load_rules(rules_path)
     evaluator = RiskRatingEvaluator(rules)
-    result = evaluator.evaluate(notes)
+    result = evaluator.evaluate(notes, normalized=True)
     output = json.dumps(result, indent=2)
     if args.output:
         args.output.write_text(output, encoding="utf-8")
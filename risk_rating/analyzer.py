@@ -1,37 +1,398 @@
 from __future__ import annotations
 
+import io
 import json
+import os
 import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Sequence, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+from .matching import StatementGroup, StatementMatcher, StatementMatches
+from .rating_kernel import KernelInputs, RatingTable
+
+_WS_RE = re.compile(r"\s+")
+_NA_EARLY = re.compile(r"not applicable|\bn/a\b")
+_WORD_SPLIT_RE = re.compile(r"\W+")
 
 
 def load_rules(path: Path | str) -> dict:
     """Load the rules JSON file."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
 def _normalize(text: str) -> str:
-    normalized = text.lower().replace("…", "...")
-    return re.sub(r"\s+", " ", normalized).strip()
+    return _WS_RE.sub(" ", text.lower().replace("…", "...")).strip()
+
+
+def normalize_chunks(chunks: Iterable[str]) -> str:
+    """Normalize notes read in pieces, as ``evaluate(..., normalized=True)`` expects.
+
+    Equivalent to normalizing ``"".join(chunks)`` in one go.
+    """
+    buffer = io.StringIO()
+    pending_space = False
+    for chunk in chunks:
+        collapsed = _WS_RE.sub(" ", chunk.lower().replace("…", "..."))
+        if collapsed.startswith(" "):
+            pending_space = True
+        core = collapsed.strip(" ")
+        if not core:
+            continue
+        # Whitespace split across a chunk boundary still collapses to one space.
+        if pending_space and buffer.tell():
+            buffer.write(" ")
+        buffer.write(core)
+        pending_space = collapsed.endswith(" ")
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _normalize_statement(statement: str) -> str:
+    """Normalize static rule text; notes go through the uncached ``_normalize``.
+
+    Results are interned so statement-keyed dict lookups compare by identity.
+    """
+    return sys.intern(_normalize(statement))
+
+
+def _acronym_token(control_id: str) -> Optional[str]:
+    token = " ".join(_WORD_SPLIT_RE.split(control_id)[1:])
+    return sys.intern(token) if token else None
+
+
+CONTROL_CATEGORIES = (
+    "logical_access_controls",
+    "network_pii_controls",
+    "network_controls",
+    "change_mgmt_sdlc",
+    "remote_workforce",
+    "business_continuity",
+)
+
+RATING_ORDER = (
+    "very_favorable",
+    "favorable",
+    "neutral",
+    "unfavorable",
+)
+
+
+@dataclass(frozen=True)
+class ControlStatus:
+    """Per-evaluation control state as bitmasks, bit ``i`` being compiled control ``i``."""
 
+    __slots__ = ("required", "satisfied")
 
-def _statement_present(notes: str, statement: str) -> bool:
-    if not statement:
-        return False
-    normalized_statement = _normalize(statement)
-    return normalized_statement in notes
+    required: int
+    satisfied: int
 
 
 @dataclass
-class ControlStatus:
-    control_id: str
-    required: bool
-    satisfied: bool
+class DocumentFindings:
+    """Everything one document contributes to its rating, before the rating is chosen."""
+
+    context: Dict[str, bool]
+    control_status: ControlStatus
+    incident_bits: int
+    info_tech_bits: int
+    business_continuity: bool
+
+    def kernel_inputs(self) -> KernelInputs:
+        return (
+            self.control_status.satisfied,
+            self.control_status.required,
+            self.info_tech_bits,
+            bin(self.incident_bits).count("1"),
+            self.context["handles_pii"],
+            self.context["software_provider"],
+            self.context["remote_work_allowed"],
+            self.business_continuity,
+        )
+
+
+@dataclass(frozen=True)
+class CompiledControl:
+    """A catalog control with its text normalized ahead of evaluation."""
+
+    id: str
+    category: str
     text: str
-    tags: Sequence[str]
+    source_text: str
+    tags: FrozenSet[str]
+    acronym_token: Optional[str]
+
+    @property
+    def match_statements(self) -> Tuple[str, ...]:
+        """Text, id and acronym token; any one of them in the notes meets the control."""
+        candidates = (self.text, self.id, self.acronym_token)
+        return tuple(statement for statement in candidates if statement)
+
+
+@dataclass(frozen=True)
+class ControlRequirement:
+    """Threshold a rating places on one category of controls."""
+
+    mask: int
+    required_all: bool
+    min_count: int
+    tag_mask: Optional[int]
+
+
+@dataclass(frozen=True)
+class ChangeMgmtRequirement:
+    controls: ControlRequirement
+    process_mask: Optional[int]
+    count_from_mask: Optional[int]
+
+
+@dataclass(frozen=True)
+class RatingSpec:
+    """One rating's requirements with control ids and tags resolved to bitmasks."""
+
+    name: str
+    info_tech_mask: int
+    logical_access: ControlRequirement
+    pii_controls_required: bool
+    network: ControlRequirement
+    change_mgmt: ChangeMgmtRequirement
+    remote_workforce: ControlRequirement
+    incident_min_elements: Optional[int]
+    business_continuity_required: bool
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """Rule data normalized once so evaluations never touch raw rule text."""
+
+    pii_group: StatementGroup
+    remote_statement: Optional[str]
+    software_group: StatementGroup
+    cross_rules: Tuple[Tuple[StatementGroup, int], ...]
+    # Element/statement ``i`` of these tuples owns bit ``i`` in a document's bitmask.
+    incident_elements: Tuple[Tuple[str, str], ...]
+    info_tech_required: Tuple[Tuple[str, str], ...]
+    controls: Tuple[CompiledControl, ...]
+    control_groups: Tuple[StatementGroup, ...]
+    control_bits: Dict[str, int]
+    all_controls_mask: int
+    category_masks: Dict[str, int]
+    tag_masks: Dict[str, int]
+    pii_dependent_mask: int
+    least_privilege_bit: int
+    need_to_know_waiver_bit: int
+    ratings: Tuple[RatingSpec, ...]
+    rating_table: RatingTable
+    matcher: StatementMatcher
+
+
+def _catalog_controls(catalog: dict) -> Iterator[Tuple[str, dict]]:
+    network_catalog = catalog.get("network_information_security", {})
+    sources = (
+        catalog.get("logical_access_controls", []),
+        network_catalog.get("pii_controls", []),
+        network_catalog.get("controls", []),
+        catalog.get("change_mgmt_sdlc", []),
+        catalog.get("remote_workforce", []),
+        catalog.get("business_continuity", []),
+    )
+    for category, controls in zip(CONTROL_CATEGORIES, sources):
+        for control in controls:
+            yield category, control
+
+
+def _control_mask(control_bits: Dict[str, int], control_ids: Sequence[str]) -> int:
+    mask = 0
+    for control_id in control_ids:
+        mask |= control_bits.get(control_id, 0)
+    return mask
+
+
+def _compile_rating(
+    name: str,
+    requirements: dict,
+    control_bits: Dict[str, int],
+    category_masks: Dict[str, int],
+    tag_masks: Dict[str, int],
+    info_tech_bits: Dict[str, int],
+) -> RatingSpec:
+    def control_requirement(
+        category: str,
+        requirement: dict,
+        required_all_key: str = "required_all",
+        allow_tag: bool = True,
+    ) -> ControlRequirement:
+        tag = requirement.get("must_include_tag") if allow_tag else None
+        return ControlRequirement(
+            mask=category_masks[category],
+            required_all=bool(requirement.get(required_all_key)),
+            min_count=requirement.get("min_count", 0),
+            tag_mask=tag_masks.get(tag, 0) if tag else None,
+        )
+
+    network = requirements.get("network_information_security", {})
+    change_mgmt = requirements.get("change_mgmt_sdlc", {})
+    remote_workforce = requirements.get("remote_workforce", {})
+    min_count_from = change_mgmt.get("min_count_from", [])
+    # Statements only a weaker rating asks for are never collected, so they
+    # map to a bit that no document can set.
+    unknown_bit = 1 << len(info_tech_bits)
+    info_tech_mask = 0
+    for statement in requirements.get("info_tech_overview", {}).get("required", []):
+        info_tech_mask |= info_tech_bits.get(statement, unknown_bit)
+    return RatingSpec(
+        name=name,
+        info_tech_mask=info_tech_mask,
+        logical_access=control_requirement(
+            "logical_access_controls", requirements.get("logical_access_controls", {})
+        ),
+        pii_controls_required=bool(network.get("pii_controls_required_if_company_handles_pii")),
+        network=control_requirement("network_controls", network, "controls_required_all"),
+        change_mgmt=ChangeMgmtRequirement(
+            controls=control_requirement("change_mgmt_sdlc", change_mgmt, allow_tag=False),
+            process_mask=(
+                control_bits.get("chg_change_mgmt_process", 0)
+                if change_mgmt.get("require_change_mgmt_process")
+                else None
+            ),
+            count_from_mask=_control_mask(control_bits, min_count_from) if min_count_from else None,
+        ),
+        remote_workforce=control_requirement("remote_workforce", remote_workforce, allow_tag=False),
+        incident_min_elements=requirements.get("incident_response", {}).get("min_elements"),
+        business_continuity_required=bool(
+            requirements.get("business_continuity", {}).get("required")
+        ),
+    )
+
+
+def compile_rules(rules: dict, software_keywords: Sequence[str] = ()) -> CompiledRules:
+    """Normalize every rule statement once and index it for matching."""
+    software_keywords = tuple(sys.intern(keyword) for keyword in software_keywords)
+    conditions = rules.get("conditions", {})
+    catalog = rules.get("catalog", {})
+    logical_conditions = conditions.get("logical_access_controls", {})
+    network_conditions = conditions.get("network_information_security", {})
+
+    remote_condition = conditions.get("remote_workforce", {}).get(
+        "enforce_only_if_remote_work_allowed", ""
+    )
+    controls = tuple(
+        CompiledControl(
+            id=sys.intern(control["id"]),
+            category=category,
+            text=_normalize_statement(control.get("text", "")),
+            source_text=control.get("text", ""),
+            tags=frozenset(sys.intern(tag) for tag in control.get("tags", [])),
+            acronym_token=_acronym_token(control["id"]),
+        )
+        for category, control in _catalog_controls(catalog)
+    )
+    category_masks = dict.fromkeys(CONTROL_CATEGORIES, 0)
+    tag_masks: Dict[str, int] = {}
+    for index, control in enumerate(controls):
+        category_masks[control.category] |= 1 << index
+        for tag in control.tags:
+            tag_masks[tag] = tag_masks.get(tag, 0) | 1 << index
+    control_bits = {control.id: 1 << index for index, control in enumerate(controls)}
+
+    pii_dependent_mask = 0
+    if logical_conditions.get("enforce_mfa_critical_or_pii_if_company_handles_pii", False):
+        pii_dependent_mask |= control_bits.get("lac_mfa_critical_or_pii", 0)
+    if network_conditions.get("enforce_pii_controls_if_company_handles_pii", False):
+        pii_dependent_mask |= category_masks["network_pii_controls"]
+    need_to_know_waiver_bit = 0
+    if network_conditions.get(
+        "do_not_enforce_need_to_know_if_least_privilege_statement_present", False
+    ):
+        need_to_know_waiver_bit = control_bits.get("net_pii_need_to_know", 0)
+
+    pii_statements = tuple(
+        _normalize_statement(statement)
+        for statement in logical_conditions.get("pii_positive_statements", [])
+    )
+    remote_statement = _normalize_statement(remote_condition) if remote_condition else None
+    cross_rules = tuple(
+        (
+            tuple(_normalize_statement(s) for s in rule.get("if_any_statement_present", [])),
+            tuple(rule.get("then_mark_controls_met", [])),
+        )
+        for rule in conditions.get("cross_satisfaction", [])
+    )
+    incident_elements = tuple(
+        (element, _normalize_statement(element))
+        for element in dict.fromkeys(catalog.get("incident_response_elements", []))
+    )
+    info_tech_required = tuple(
+        (statement, _normalize_statement(statement))
+        for statement in dict.fromkeys(
+            rules["ratings"]["very_favorable"]["info_tech_overview"].get("required", [])
+        )
+    )
+
+    statements: List[str] = list(pii_statements)
+    if remote_statement:
+        statements.append(remote_statement)
+    statements.extend(software_keywords)
+    for if_any, _ in cross_rules:
+        statements.extend(if_any)
+    for control in controls:
+        statements.extend(control.match_statements)
+    statements.extend(normalized for _, normalized in incident_elements)
+    statements.extend(normalized for _, normalized in info_tech_required)
+    matcher = StatementMatcher(statements)
+
+    info_tech_bits = {statement: 1 << index for index, (statement, _) in enumerate(info_tech_required)}
+    ratings = tuple(
+        _compile_rating(
+            name, rules["ratings"][name], control_bits, category_masks, tag_masks, info_tech_bits
+        )
+        for name in RATING_ORDER
+    )
+
+    return CompiledRules(
+        pii_group=matcher.group(pii_statements),
+        remote_statement=remote_statement,
+        software_group=matcher.group(software_keywords),
+        cross_rules=tuple(
+            (matcher.group(if_any), _control_mask(control_bits, then_mark))
+            for if_any, then_mark in cross_rules
+        ),
+        incident_elements=incident_elements,
+        info_tech_required=info_tech_required,
+        controls=controls,
+        control_groups=tuple(
+            matcher.group(control.match_statements) for control in controls
+        ),
+        control_bits=control_bits,
+        all_controls_mask=(1 << len(controls)) - 1,
+        category_masks=category_masks,
+        tag_masks=tag_masks,
+        pii_dependent_mask=pii_dependent_mask,
+        least_privilege_bit=control_bits.get("lac_least_privilege", 0),
+        need_to_know_waiver_bit=need_to_know_waiver_bit,
+        ratings=ratings,
+        rating_table=RatingTable(
+            ratings,
+            pii_mask=category_masks["network_pii_controls"],
+            bit_width=max(len(controls), len(info_tech_bits) + 1),
+        ),
+        matcher=matcher,
+    )
+
+
+@lru_cache(maxsize=16)
+def _load_compiled(path: str, mtime: float, software_keywords: Tuple[str, ...]) -> CompiledRules:
+    return compile_rules(load_rules(path), software_keywords)
 
 
 class RiskRatingEvaluator:
@@ -49,16 +410,65 @@ class RiskRatingEvaluator:
         "application development",
     ]
 
-    def __init__(self, rules: dict):
+    def __init__(self, rules: dict, compiled: Optional[CompiledRules] = None):
         self.rules = rules
+        if compiled is None:
+            compiled = compile_rules(rules, self.SOFTWARE_PROVIDER_KEYWORDS)
+        self.compiled = compiled
         self.notes: str = ""
+        self._matched = StatementMatches(set())
 
     @classmethod
     def from_path(cls, path: Path | str) -> "RiskRatingEvaluator":
-        return cls(load_rules(path))
+        """Build an evaluator, reusing compiled rules while the file is unchanged.
+
+        Each evaluator gets its own ``rules`` dict. Evaluation reads only the
+        compiled rules, so build a new evaluator to pick up edits to ``rules``.
+        """
+        path = os.path.realpath(path)
+        compiled = _load_compiled(
+            path, os.stat(path).st_mtime, tuple(cls.SOFTWARE_PROVIDER_KEYWORDS)
+        )
+        return cls(load_rules(path), compiled)
+
+    def _statement_present(self, statement: Optional[str]) -> bool:
+        """Check a normalized statement against the current notes sweep."""
+        statement_id = self.compiled.matcher.ids.get(statement) if statement else None
+        return statement_id is not None and statement_id in self._matched
+
+    def evaluate(self, notes: str, normalized: bool = False) -> dict:
+        self.notes = notes if normalized else _normalize(notes)
+        early_result = self._early_result()
+        if early_result is not None:
+            return early_result
+
+        findings = self._collect_findings()
+        rating_index = self.compiled.rating_table.first_match(*findings.kernel_inputs())
+        return self._build_result(findings, rating_index)
+
+    def evaluate_batch(self, notes_iter: Iterable[str]) -> List[dict]:
+        """Evaluate many documents, choosing all of their ratings in one batched call."""
+        early_results: List[Optional[dict]] = []
+        pending: List[DocumentFindings] = []
+        for notes in notes_iter:
+            self.notes = _normalize(notes)
+            early_result = self._early_result()
+            if early_result is None:
+                pending.append(self._collect_findings())
+            early_results.append(early_result)
+
+        rating_indices = self.compiled.rating_table.first_match_batch(
+            [findings.kernel_inputs() for findings in pending]
+        )
+        rated = iter(
+            [
+                self._build_result(findings, rating_index)
+                for findings, rating_index in zip(pending, rating_indices)
+            ]
+        )
+        return [result if result is not None else next(rated) for result in early_results]
 
-    def evaluate(self, notes: str) -> dict:
-        self.notes = _normalize(notes)
+    def _early_result(self) -> Optional[dict]:
         if not self.notes:
             return {
                 "rating": "no_information_provided",
@@ -70,7 +480,7 @@ class RiskRatingEvaluator:
                 },
             }
 
-        if "not applicable" in self.notes or re.search(r"\bn/a\b", self.notes):
+        if _NA_EARLY.search(self.notes):
             return {
                 "rating": "n_a",
                 "details": {},
@@ -80,22 +490,25 @@ class RiskRatingEvaluator:
                     "software_provider": False,
                 },
             }
+        return None
 
+    def _collect_findings(self) -> DocumentFindings:
+        self._matched = self.compiled.matcher.scan(self.notes)
         context = self._build_context()
         cross_satisfied = self._apply_cross_satisfaction()
         control_status = self._evaluate_controls(context, cross_satisfied)
-        incident_elements = self._collect_incident_response_elements()
-        info_tech_overview = self._evaluate_info_tech_overview()
-        business_continuity = self._evaluate_business_continuity(control_status)
-
-        rating, rating_details = self._determine_rating(
-            context,
-            control_status,
-            incident_elements,
-            info_tech_overview,
-            business_continuity,
+
+        return DocumentFindings(
+            context=context,
+            control_status=control_status,
+            incident_bits=self._collect_incident_response_elements(),
+            info_tech_bits=self._evaluate_info_tech_overview(),
+            business_continuity=self._evaluate_business_continuity(control_status),
         )
 
+    def _build_result(self, findings: DocumentFindings, rating_index: int) -> dict:
+        rating, rating_details = self._determine_rating(findings, rating_index)
+        context = findings.context
         return {
             "rating": rating,
             "details": rating_details,
@@ -103,29 +516,17 @@ class RiskRatingEvaluator:
                 "handles_pii": context["handles_pii"],
                 "remote_work_allowed": context["remote_work_allowed"],
                 "software_provider": context["software_provider"],
-                "incident_elements": sorted(incident_elements),
+                "incident_elements": self._names_in_mask(
+                    self.compiled.incident_elements, findings.incident_bits
+                ),
             },
         }
 
     def _build_context(self) -> Dict[str, bool]:
-        logical_conditions = self.rules["conditions"].get("logical_access_controls", {})
-        handles_pii = any(
-            _statement_present(self.notes, stmt)
-            for stmt in logical_conditions.get("pii_positive_statements", [])
-        )
-
-        remote_condition = (
-            self.rules["conditions"].get("remote_workforce", {}).get(
-                "enforce_only_if_remote_work_allowed", ""
-            )
-        )
-        remote_allowed = bool(remote_condition) and _statement_present(
-            self.notes, remote_condition
-        )
-
-        software_provider = any(
-            phrase in self.notes for phrase in self.SOFTWARE_PROVIDER_KEYWORDS
-        )
+        compiled = self.compiled
+        handles_pii = self._matched.any(compiled.pii_group)
+        remote_allowed = self._statement_present(compiled.remote_statement)
+        software_provider = self._matched.any(compiled.software_group)
 
         return {
             "handles_pii": handles_pii,
@@ -133,170 +534,59 @@ class RiskRatingEvaluator:
             "software_provider": software_provider,
         }
 
-    def _apply_cross_satisfaction(self) -> Set[str]:
-        cross_rules = self.rules["conditions"].get("cross_satisfaction", [])
-        satisfied: Set[str] = set()
-        for rule in cross_rules:
-            if_any = rule.get("if_any_statement_present", [])
-            for statement in if_any:
-                if _statement_present(self.notes, statement):
-                    satisfied.update(rule.get("then_mark_controls_met", []))
-                    break
+    def _apply_cross_satisfaction(self) -> int:
+        satisfied = 0
+        for if_any, then_mark in self.compiled.cross_rules:
+            if self._matched.any(if_any):
+                satisfied |= then_mark
         return satisfied
 
-    def _evaluate_controls(
-        self, context: Dict[str, bool], cross_satisfied: Set[str]
-    ) -> Dict[str, ControlStatus]:
-        status: Dict[str, ControlStatus] = {}
-        conditions = self.rules.get("conditions", {})
-
-        def register_control(control_id: str, required: bool, satisfied: bool, text: str, tags: Sequence[str]) -> None:
-            status[control_id] = ControlStatus(
-                control_id=control_id,
-                required=required,
-                satisfied=satisfied,
-                text=text,
-                tags=tags,
-            )
-
-        def check_control(control: dict, required: bool = True) -> None:
-            control_id = control["id"]
-            control_text = control.get("text", "")
-            satisfied = False
-            if control_id in cross_satisfied:
-                satisfied = True
-            else:
-                satisfied = self._statement_satisfies_control(control_id, control_text)
-            register_control(control_id, required, satisfied, control_text, control.get("tags", []))
-
-        catalog = self.rules.get("catalog", {})
-
-        for control in catalog.get("logical_access_controls", []):
-            required = True
-            if (
-                control["id"] == "lac_mfa_critical_or_pii"
-                and conditions.get("logical_access_controls", {}).get(
-                    "enforce_mfa_critical_or_pii_if_company_handles_pii", False
-                )
-                and not context["handles_pii"]
-            ):
-                required = False
-            check_control(control, required)
-
-        network_catalog = catalog.get("network_information_security", {})
-        for control in network_catalog.get("pii_controls", []):
-            required = not (
-                conditions.get("network_information_security", {}).get(
-                    "enforce_pii_controls_if_company_handles_pii", False
-                )
-                and not context["handles_pii"]
-            )
-            if (
-                control["id"] == "net_pii_need_to_know"
-                and conditions.get("network_information_security", {}).get(
-                    "do_not_enforce_need_to_know_if_least_privilege_statement_present", False
-                )
-            ):
-                least_privilege = status.get("lac_least_privilege")
-                if least_privilege and least_privilege.satisfied:
-                    register_control(
-                        control["id"],
-                        required=False,
-                        satisfied=True,
-                        text=control.get("text", ""),
-                        tags=control.get("tags", []),
-                    )
-                    continue
-            check_control(control, required)
-
-        for control in network_catalog.get("controls", []):
-            check_control(control, required=True)
-
-        for control in catalog.get("change_mgmt_sdlc", []):
-            required = context["software_provider"]
-            check_control(control, required)
-
-        for control in catalog.get("remote_workforce", []):
-            required = context["remote_work_allowed"]
-            check_control(control, required)
-
-        for control in catalog.get("business_continuity", []):
-            check_control(control, required=True)
-
-        return status
-
-    def _statement_satisfies_control(self, control_id: str, control_text: str) -> bool:
-        if _statement_present(self.notes, control_text):
-            return True
-        if control_id and control_id in self.notes:
-            return True
-        words = re.split(r"\W+", control_id)
-        if len(words) > 1:
-            # Ensure acronym-like tokens also work
-            token = " ".join(words[1:])
-            if token and token in self.notes:
-                return True
-        # Handle negative statements overriding positives
-        if control_id == "lac_passwords_encrypted_in_transit":
-            negatives = self.rules["conditions"]["logical_access_controls"].get(
-                "passwords_encrypted_in_transit_only_if_negative_statement_present", []
-            )
-            if any(_statement_present(self.notes, neg) for neg in negatives):
-                return False
-        return False
-
-    def _collect_incident_response_elements(self) -> Set[str]:
-        elements = set()
-        for element in self.rules["catalog"].get("incident_response_elements", []):
-            if _statement_present(self.notes, element):
-                elements.add(element)
-        return elements
-
-    def _evaluate_info_tech_overview(self) -> Set[str]:
-        required = self.rules["ratings"]["very_favorable"]["info_tech_overview"].get("required", [])
-        present = set()
-        for statement in required:
-            if _statement_present(self.notes, statement):
-                present.add(statement)
-        return present
-
-    def _evaluate_business_continuity(self, control_status: Dict[str, ControlStatus]) -> bool:
-        bcp_control = control_status.get("bcp_plan")
-        return bool(bcp_control and bcp_control.satisfied)
-
-    def _determine_rating(
-        self,
-        context: Dict[str, bool],
-        control_status: Dict[str, ControlStatus],
-        incident_elements: Set[str],
-        info_tech_overview: Set[str],
-        business_continuity: bool,
-    ) -> Tuple[str, dict]:
-        ratings_order = [
-            "very_favorable",
-            "favorable",
-            "neutral",
-            "unfavorable",
-        ]
-
-        for rating in ratings_order:
-            requirements = self.rules["ratings"][rating]
-            if self._meets_rating(
-                rating,
-                requirements,
-                context,
-                control_status,
-                incident_elements,
-                info_tech_overview,
-                business_continuity,
-            ):
-                return rating, self._build_rating_details(
-                    rating,
-                    requirements,
-                    control_status,
-                    incident_elements,
-                    info_tech_overview,
-                )
+    def _evaluate_controls(self, context: Dict[str, bool], cross_satisfied: int) -> ControlStatus:
+        compiled = self.compiled
+        required = compiled.all_controls_mask
+        if not context["handles_pii"]:
+            required &= ~compiled.pii_dependent_mask
+        if not context["software_provider"]:
+            required &= ~compiled.category_masks["change_mgmt_sdlc"]
+        if not context["remote_work_allowed"]:
+            required &= ~compiled.category_masks["remote_workforce"]
+
+        # A control is met by its text, its id or its acronym token. Negative
+        # statements could only ever veto a control none of these matched, so
+        # they never change the outcome and need no lookup.
+        satisfied = cross_satisfied
+        matched = self._matched
+        for index, group in enumerate(compiled.control_groups):
+            if matched.any(group):
+                satisfied |= 1 << index
+
+        if satisfied & compiled.least_privilege_bit:
+            required &= ~compiled.need_to_know_waiver_bit
+            satisfied |= compiled.need_to_know_waiver_bit
+
+        return ControlStatus(required=required, satisfied=satisfied)
+
+    def _collect_incident_response_elements(self) -> int:
+        return self._statement_bits(self.compiled.incident_elements)
+
+    def _evaluate_info_tech_overview(self) -> int:
+        return self._statement_bits(self.compiled.info_tech_required)
+
+    def _statement_bits(self, statements: Tuple[Tuple[str, str], ...]) -> int:
+        bits = 0
+        for index, (_, normalized) in enumerate(statements):
+            if self._statement_present(normalized):
+                bits |= 1 << index
+        return bits
+
+    def _evaluate_business_continuity(self, control_status: ControlStatus) -> bool:
+        return bool(control_status.satisfied & self.compiled.control_bits.get("bcp_plan", 0))
+
+    def _determine_rating(self, findings: DocumentFindings, rating_index: int) -> Tuple[str, dict]:
+        control_status = findings.control_status
+        if rating_index >= 0:
+            rating = self.compiled.ratings[rating_index].name
+            return rating, self._build_rating_details(rating, findings)
 
         # Did not meet unfavorable: automatically very unfavorable
         return "very_unfavorable", {
@@ -304,177 +594,29 @@ class RiskRatingEvaluator:
             "missing_controls": self._missing_required_controls(control_status),
         }
 
-    def _meets_rating(
-        self,
-        rating: str,
-        requirements: dict,
-        context: Dict[str, bool],
-        control_status: Dict[str, ControlStatus],
-        incident_elements: Set[str],
-        info_tech_overview: Set[str],
-        business_continuity: bool,
-    ) -> bool:
-        if not self._meets_info_tech_overview(requirements.get("info_tech_overview", {}), info_tech_overview):
-            return False
-
-        if not self._meets_logical_access_controls(
-            requirements.get("logical_access_controls", {}), control_status
-        ):
-            return False
-
-        if not self._meets_network_controls(
-            requirements.get("network_information_security", {}),
-            context,
-            control_status,
-        ):
-            return False
-
-        if not self._meets_change_mgmt(
-            requirements.get("change_mgmt_sdlc", {}), context, control_status
-        ):
-            return False
-
-        if not self._meets_remote_workforce(
-            requirements.get("remote_workforce", {}), context, control_status
-        ):
-            return False
-
-        if not self._meets_incident_response(requirements.get("incident_response", {}), incident_elements):
-            return False
-
-        if not self._meets_business_continuity(requirements.get("business_continuity", {}), business_continuity):
-            return False
-
-        return True
-
-    def _meets_info_tech_overview(self, requirement: dict, present: Set[str]) -> bool:
-        required = requirement.get("required", [])
-        return all(statement in present for statement in required)
-
-    def _category_controls(self, prefix: str, status: Dict[str, ControlStatus]) -> List[ControlStatus]:
-        return [ctrl for ctrl_id, ctrl in status.items() if ctrl_id.startswith(prefix)]
-
-    def _meets_logical_access_controls(self, requirement: dict, status: Dict[str, ControlStatus]) -> bool:
-        controls = self._category_controls("lac_", status)
-        required_controls = [ctrl for ctrl in controls if ctrl.required]
-        if requirement.get("required_all"):
-            return all(ctrl.satisfied for ctrl in required_controls)
-        count = sum(1 for ctrl in required_controls if ctrl.satisfied)
-        if count < requirement.get("min_count", 0):
-            return False
-        tag = requirement.get("must_include_tag")
-        if tag:
-            if not any(ctrl.satisfied and tag in ctrl.tags for ctrl in required_controls):
-                return False
-        return True
-
-    def _meets_network_controls(
-        self,
-        requirement: dict,
-        context: Dict[str, bool],
-        status: Dict[str, ControlStatus],
-    ) -> bool:
-        pii_controls = [ctrl for ctrl in self._category_controls("net_pii_", status) if ctrl.required]
-        if requirement.get("pii_controls_required_if_company_handles_pii") and context["handles_pii"]:
-            if not pii_controls:
-                return False
-            if not all(ctrl.satisfied for ctrl in pii_controls):
-                return False
-
-        net_controls = [
-            ctrl
-            for ctrl in status.values()
-            if ctrl.control_id.startswith("net_") and not ctrl.control_id.startswith("net_pii_")
-        ]
-        required_controls = [ctrl for ctrl in net_controls if ctrl.required]
-        if requirement.get("controls_required_all"):
-            return all(ctrl.satisfied for ctrl in required_controls)
-
-        count = sum(1 for ctrl in required_controls if ctrl.satisfied)
-        if count < requirement.get("min_count", 0):
-            return False
-        tag = requirement.get("must_include_tag")
-        if tag and not any(ctrl.satisfied and tag in ctrl.tags for ctrl in required_controls):
-            return False
-        return True
-
-    def _meets_change_mgmt(self, requirement: dict, context: Dict[str, bool], status: Dict[str, ControlStatus]) -> bool:
-        controls = self._category_controls("chg_", status)
-        required_controls = [ctrl for ctrl in controls if ctrl.required]
-        if not context["software_provider"]:
-            return True
-        if requirement.get("required_all"):
-            return all(ctrl.satisfied for ctrl in required_controls)
-        if requirement.get("require_change_mgmt_process"):
-            change_mgmt = status.get("chg_change_mgmt_process")
-            if not change_mgmt or not change_mgmt.satisfied:
-                return False
-        min_count_from = requirement.get("min_count_from", [])
-        if min_count_from:
-            satisfied_count = sum(
-                1
-                for control_id in min_count_from
-                if status.get(control_id) and status[control_id].satisfied
-            )
-            if satisfied_count < requirement.get("min_count", 0):
-                return False
-        else:
-            count = sum(1 for ctrl in required_controls if ctrl.satisfied)
-            if count < requirement.get("min_count", 0):
-                return False
-        return True
-
-    def _meets_remote_workforce(
-        self,
-        requirement: dict,
-        context: Dict[str, bool],
-        status: Dict[str, ControlStatus],
-    ) -> bool:
-        controls = self._category_controls("rw_", status)
-        required_controls = [ctrl for ctrl in controls if ctrl.required]
-        if not context["remote_work_allowed"]:
-            return True
-        if requirement.get("required_all"):
-            return all(ctrl.satisfied for ctrl in required_controls)
-        count = sum(1 for ctrl in required_controls if ctrl.satisfied)
-        if count < requirement.get("min_count", 0):
-            return False
-        return True
-
-    def _meets_incident_response(self, requirement: dict, elements: Set[str]) -> bool:
-        min_elements = requirement.get("min_elements")
-        if min_elements is None:
-            return True
-        return len(elements) >= min_elements
-
-    def _meets_business_continuity(self, requirement: dict, has_plan: bool) -> bool:
-        if not requirement:
-            return True
-        if requirement.get("required") and not has_plan:
-            return False
-        return True
-
-    def _build_rating_details(
-        self,
-        rating: str,
-        requirements: dict,
-        status: Dict[str, ControlStatus],
-        incident_elements: Set[str],
-        info_tech_overview: Set[str],
-    ) -> dict:
+    def _build_rating_details(self, rating: str, findings: DocumentFindings) -> dict:
+        status = findings.control_status
+        compiled = self.compiled
         details = {
             "rating": rating,
-            "satisfied_controls": sorted(
-                ctrl.control_id for ctrl in status.values() if ctrl.satisfied and ctrl.required
-            ),
+            "satisfied_controls": self._controls_in_mask(status.required & status.satisfied),
             "missing_controls": self._missing_required_controls(status),
-            "incident_response_elements": sorted(incident_elements),
-            "info_tech_overview": sorted(info_tech_overview),
+            "incident_response_elements": self._names_in_mask(
+                compiled.incident_elements, findings.incident_bits
+            ),
+            "info_tech_overview": self._names_in_mask(
+                compiled.info_tech_required, findings.info_tech_bits
+            ),
         }
         return details
 
-    def _missing_required_controls(self, status: Dict[str, ControlStatus]) -> List[str]:
-        missing = [ctrl.control_id for ctrl in status.values() if ctrl.required and not ctrl.satisfied]
-        missing.sort()
-        return missing
+    def _names_in_mask(self, statements: Tuple[Tuple[str, str], ...], mask: int) -> List[str]:
+        return sorted(name for index, (name, _) in enumerate(statements) if mask >> index & 1)
 
+    def _missing_required_controls(self, status: ControlStatus) -> List[str]:
+        return self._controls_in_mask(status.required & ~status.satisfied)
+
+    def _controls_in_mask(self, mask: int) -> List[str]:
+        return sorted(
+            control.id for index, control in enumerate(self.compiled.controls) if mask >> index & 1
+        )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, FrozenSet, Iterable, Optional, Pattern, Set
+
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+# Below this many members, separate cached substring checks beat one pass of
+# the combined alternation in the fallback matcher.
+MIN_PATTERN_GROUP = 4
+
+
+class StatementGroup:
+    """Statements checked together, where any one of them being present is enough."""
+
+    __slots__ = ("ids", "pattern")
+
+    def __init__(self, ids: FrozenSet[int], pattern: Optional[Pattern[str]]):
+        self.ids = ids
+        self.pattern = pattern
+
+
+class StatementMatches:
+    """Statement ids found in one set of notes by an Aho-Corasick sweep."""
+
+    def __init__(self, found: Set[int]):
+        self._found = found
+
+    def __contains__(self, statement_id: object) -> bool:
+        return statement_id in self._found
+
+    def any(self, group: StatementGroup) -> bool:
+        return not self._found.isdisjoint(group.ids)
+
+
+class _LazyStatementMatches(StatementMatches):
+    """Substring fallback that only scans for the statements actually asked about."""
+
+    def __init__(self, notes: str, statements: Dict[int, str]):
+        super().__init__(set())
+        self._notes = notes
+        self._statements = statements
+        self._missing: Set[int] = set()
+
+    def __contains__(self, statement_id: object) -> bool:
+        if statement_id in self._found:
+            return True
+        if statement_id in self._missing or statement_id not in self._statements:
+            return False
+        if self._statements[statement_id] in self._notes:
+            self._found.add(statement_id)
+            return True
+        self._missing.add(statement_id)
+        return False
+
+    def any(self, group: StatementGroup) -> bool:
+        if len(group.ids) < MIN_PATTERN_GROUP:
+            return any(statement_id in self for statement_id in group.ids)
+        # One pass of the combined alternation instead of a scan per statement.
+        return group.pattern is not None and group.pattern.search(self._notes) is not None
+
+
+class StatementMatcher:
+    """Find every known rule statement in the notes with a single sweep."""
+
+    def __init__(self, statements: Iterable[str]):
+        self.ids: Dict[str, int] = {}
+        for statement in statements:
+            if statement and statement not in self.ids:
+                self.ids[statement] = len(self.ids)
+        self._statements = {statement_id: statement for statement, statement_id in self.ids.items()}
+
+        self._automaton = None
+        if ahocorasick is not None and self.ids:
+            automaton = ahocorasick.Automaton()
+            for statement, statement_id in self.ids.items():
+                automaton.add_word(statement, statement_id)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def group(self, statements: Iterable[str]) -> StatementGroup:
+        """Build a group from statements that were passed to the constructor."""
+        members = sorted({statement for statement in statements if statement in self.ids})
+        pattern = None
+        if members:
+            pattern = re.compile("|".join(re.escape(statement) for statement in members))
+        return StatementGroup(frozenset(self.ids[statement] for statement in members), pattern)
+
+    def scan(self, notes: str) -> StatementMatches:
+        """Return the statements occurring in ``notes``."""
+        if self._automaton is not None:
+            return StatementMatches({statement_id for _, statement_id in self._automaton.iter(notes)})
+        # Without pyahocorasick, test statements on demand with substring scans.
+        return _LazyStatementMatches(notes, self._statements)
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .analyzer import ControlRequirement, RatingSpec
+
+# Column layout of one rating row. Optional values carry a separate flag
+# column so every cell stays a plain integer the JIT can specialise on.
+INFO_TECH_MASK = 0
+PII_CONTROLS_REQUIRED = 1
+INCIDENT_MIN_ELEMENTS = 2
+BUSINESS_CONTINUITY_REQUIRED = 3
+CHG_HAS_PROCESS = 4
+CHG_PROCESS_MASK = 5
+CHG_HAS_COUNT_FROM = 6
+CHG_COUNT_FROM_MASK = 7
+
+# Each control category occupies a block of five columns starting here.
+LOGICAL_ACCESS = 8
+NETWORK = 13
+CHANGE_MGMT = 18
+REMOTE_WORKFORCE = 23
+ROW_WIDTH = 28
+
+MASK = 0
+REQUIRED_ALL = 1
+MIN_COUNT = 2
+HAS_TAG = 3
+TAG_MASK = 4
+
+# Widest bitmask the int64 numpy and JIT paths can hold without overflowing.
+_INT64_MAX_BITS = 63
+
+# Per-document kernel inputs: satisfied, required, info_bits, incident_count,
+# handles_pii, software_provider, remote_work_allowed, has_plan.
+KernelInputs = Tuple[int, int, int, int, bool, bool, bool, bool]
+
+
+def _control_columns(requirement: ControlRequirement) -> Tuple[int, ...]:
+    return (
+        requirement.mask,
+        int(requirement.required_all),
+        requirement.min_count,
+        int(requirement.tag_mask is not None),
+        requirement.tag_mask or 0,
+    )
+
+
+def rating_row(spec: RatingSpec) -> Tuple[int, ...]:
+    change_mgmt = spec.change_mgmt
+    return (
+        spec.info_tech_mask,
+        int(spec.pii_controls_required),
+        -1 if spec.incident_min_elements is None else spec.incident_min_elements,
+        int(spec.business_continuity_required),
+        int(change_mgmt.process_mask is not None),
+        change_mgmt.process_mask or 0,
+        int(change_mgmt.count_from_mask is not None),
+        change_mgmt.count_from_mask or 0,
+        *_control_columns(spec.logical_access),
+        *_control_columns(spec.network),
+        *_control_columns(change_mgmt.controls),
+        *_control_columns(spec.remote_workforce),
+    )
+
+
+def first_matching_rating(
+    table,
+    pii_mask,
+    satisfied,
+    required,
+    info_bits,
+    incident_count,
+    handles_pii,
+    software_provider,
+    remote_work_allowed,
+    has_plan,
+):
+    """Return the index of the first rating row met by the document, or -1."""
+    for rating in range(len(table)):
+        row = table[rating]
+        if info_bits & row[INFO_TECH_MASK] != row[INFO_TECH_MASK]:
+            continue
+        if row[INCIDENT_MIN_ELEMENTS] >= 0 and incident_count < row[INCIDENT_MIN_ELEMENTS]:
+            continue
+        if row[BUSINESS_CONTINUITY_REQUIRED] and not has_plan:
+            continue
+        if row[PII_CONTROLS_REQUIRED] and handles_pii:
+            pii_required = required & pii_mask
+            if pii_required == 0 or satisfied & pii_required != pii_required:
+                continue
+
+        met_all = True
+        for block in (LOGICAL_ACCESS, NETWORK, CHANGE_MGMT, REMOTE_WORKFORCE):
+            if block == CHANGE_MGMT and not software_provider:
+                continue
+            if block == REMOTE_WORKFORCE and not remote_work_allowed:
+                continue
+            mask = row[block + MASK]
+            if row[block + REQUIRED_ALL]:
+                block_required = required & mask
+                if satisfied & block_required != block_required:
+                    met_all = False
+                    break
+                continue
+
+            if block == CHANGE_MGMT:
+                if row[CHG_HAS_PROCESS] and satisfied & row[CHG_PROCESS_MASK] == 0:
+                    met_all = False
+                    break
+                if row[CHG_HAS_COUNT_FROM]:
+                    met = satisfied & row[CHG_COUNT_FROM_MASK]
+                else:
+                    met = required & satisfied & mask
+            else:
+                met = required & satisfied & mask
+
+            count = 0
+            remaining = met
+            while remaining:
+                remaining &= remaining - 1
+                count += 1
+            if count < row[block + MIN_COUNT]:
+                met_all = False
+                break
+            if row[block + HAS_TAG] and met & row[block + TAG_MASK] == 0:
+                met_all = False
+                break
+
+        if met_all:
+            return rating
+    return -1
+
+
+def _popcount64(values):
+    as_bytes = np.ascontiguousarray(values, dtype=np.int64).view(np.uint8)
+    return np.unpackbits(as_bytes.reshape(values.shape + (8,)), axis=-1).sum(axis=-1)
+
+
+def first_matching_rating_batch(table, pii_mask, documents):
+    """Vectorized ``first_matching_rating`` over an ``(n_docs, 8)`` int64 input matrix."""
+    satisfied = documents[:, 0:1]
+    required = documents[:, 1:2]
+    info_bits = documents[:, 2:3]
+    incident_count = documents[:, 3:4]
+    handles_pii = documents[:, 4:5] != 0
+    software_provider = documents[:, 5:6] != 0
+    remote_work_allowed = documents[:, 6:7] != 0
+    has_plan = documents[:, 7:8] != 0
+
+    def column(index):
+        return table[:, index][None, :]
+
+    def flag(index):
+        return column(index) != 0
+
+    info_mask = column(INFO_TECH_MASK)
+    met = (info_bits & info_mask) == info_mask
+    met &= (column(INCIDENT_MIN_ELEMENTS) < 0) | (incident_count >= column(INCIDENT_MIN_ELEMENTS))
+    met &= ~flag(BUSINESS_CONTINUITY_REQUIRED) | has_plan
+    pii_required = required & pii_mask
+    pii_met = (pii_required != 0) & ((satisfied & pii_required) == pii_required)
+    met &= ~(flag(PII_CONTROLS_REQUIRED) & handles_pii) | pii_met
+
+    for block, applies in (
+        (LOGICAL_ACCESS, None),
+        (NETWORK, None),
+        (CHANGE_MGMT, software_provider),
+        (REMOTE_WORKFORCE, remote_work_allowed),
+    ):
+        mask = column(block + MASK)
+        block_required = required & mask
+        all_met = (satisfied & block_required) == block_required
+        if block == CHANGE_MGMT:
+            counted = np.where(
+                flag(CHG_HAS_COUNT_FROM),
+                satisfied & column(CHG_COUNT_FROM_MASK),
+                required & satisfied & mask,
+            )
+            threshold_met = ~flag(CHG_HAS_PROCESS) | ((satisfied & column(CHG_PROCESS_MASK)) != 0)
+        else:
+            counted = required & satisfied & mask
+            threshold_met = np.ones_like(all_met)
+        threshold_met &= _popcount64(counted) >= column(block + MIN_COUNT)
+        threshold_met &= ~flag(block + HAS_TAG) | ((counted & column(block + TAG_MASK)) != 0)
+        block_met = np.where(flag(block + REQUIRED_ALL), all_met, threshold_met)
+        if applies is not None:
+            block_met |= ~applies
+        met &= block_met
+
+    return np.where(met.any(axis=1), met.argmax(axis=1), -1)
+
+
+@lru_cache(maxsize=None)
+def _jit_first_matching_rating() -> Optional[Callable[..., int]]:
+    """Return the Numba-compiled kernel, or None when numba is not installed.
+
+    Importing numba costs far more than a single rating check, so only batch
+    evaluation asks for it.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return njit(cache=True, boundscheck=False)(first_matching_rating)
+
+
+class RatingTable:
+    """Rating requirements flattened into integer rows, one per rating in order."""
+
+    def __init__(self, specs: Iterable[RatingSpec], pii_mask: int, bit_width: int):
+        self.rows: Sequence[Tuple[int, ...]] = tuple(rating_row(spec) for spec in specs)
+        self.pii_mask = pii_mask
+        self._array = None
+        if np is not None and self.rows and bit_width <= _INT64_MAX_BITS:
+            self._array = np.array(self.rows, dtype=np.int64)
+
+    def first_match(
+        self,
+        satisfied: int,
+        required: int,
+        info_bits: int,
+        incident_count: int,
+        handles_pii: bool,
+        software_provider: bool,
+        remote_work_allowed: bool,
+        has_plan: bool,
+    ) -> int:
+        return first_matching_rating(
+            self.rows,
+            self.pii_mask,
+            satisfied,
+            required,
+            info_bits,
+            incident_count,
+            handles_pii,
+            software_provider,
+            remote_work_allowed,
+            has_plan,
+        )
+
+    def first_match_batch(self, documents: Sequence[KernelInputs]) -> List[int]:
+        """Return ``first_match`` for many documents, compiled or vectorized when possible."""
+        if self._array is None or not documents:
+            return [self.first_match(*inputs) for inputs in documents]
+        kernel = _jit_first_matching_rating()
+        if kernel is not None:
+            return [int(kernel(self._array, self.pii_mask, *inputs)) for inputs in documents]
+        matrix = np.array(documents, dtype=np.int64).reshape(len(documents), 8)
+        return first_matching_rating_batch(self._array, self.pii_mask, matrix).tolist()
@@ -0,0 +1,42 @@
+import random
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from risk_rating import RiskRatingEvaluator, load_rules
+
+ROOT = Path(__file__).resolve().parent.parent
+RULES_PATH = ROOT / "rules" / "rating_rules.json"
+SAMPLE_NOTES_PATH = ROOT / "sample_notes.txt"
+
+
+@pytest.fixture(scope="session")
+def rules_path() -> Path:
+    return RULES_PATH
+
+
+@pytest.fixture(scope="session")
+def rules(rules_path) -> dict:
+    return load_rules(rules_path)
+
+
+@pytest.fixture(scope="module")
+def evaluator(rules) -> RiskRatingEvaluator:
+    return RiskRatingEvaluator(rules)
+
+
+@pytest.fixture(scope="session")
+def sample_notes() -> str:
+    return SAMPLE_NOTES_PATH.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def sample_documents(sample_notes) -> List[str]:
+    """Documents built from random subsets of the sample notes, plus the edge cases."""
+    lines = sample_notes.splitlines()
+    rng = random.Random(0)
+    documents = ["", "   ", "Not applicable.", "N/A for this vendor", "\n".join(lines)]
+    for _ in range(200):
+        documents.append("\n".join(rng.sample(lines, rng.randint(1, len(lines)))))
+    return documents
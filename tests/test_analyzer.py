@@ -0,0 +1,31 @@
+import os
+import random
+
+from risk_rating import RiskRatingEvaluator, normalize_chunks
+from risk_rating.analyzer import _normalize
+
+
+def test_evaluate_batch_matches_evaluate(evaluator, sample_documents):
+    expected = [evaluator.evaluate(notes) for notes in sample_documents]
+    assert evaluator.evaluate_batch(sample_documents) == expected
+    assert {result["rating"] for result in expected} >= {"n_a", "no_information_provided"}
+
+
+def test_from_path_shares_compiled_rules_only(rules_path):
+    first = RiskRatingEvaluator.from_path(rules_path)
+    second = RiskRatingEvaluator.from_path(os.path.relpath(rules_path))
+    assert second.compiled is first.compiled
+
+    first.rules["ratings"]["favorable"]["logical_access_controls"]["min_count"] = 99
+    assert second.rules["ratings"]["favorable"]["logical_access_controls"].get("min_count") != 99
+    assert RiskRatingEvaluator.from_path(rules_path).rules == second.rules
+
+
+def test_normalize_chunks_matches_whole_text_normalization():
+    rng = random.Random(0)
+    alphabet = "aB …\t\n\r\u00a0 \u2028x/."
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+        cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 6)))
+        chunks = [text[start:end] for start, end in zip([0, *cuts], [*cuts, len(text)])]
+        assert normalize_chunks(chunks) == _normalize(text), chunks
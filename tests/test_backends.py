@@ -0,0 +1,87 @@
+"""The optional accelerated backends must agree with the pure-Python ones."""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from risk_rating import RiskRatingEvaluator, matching
+from risk_rating.analyzer import _normalize
+from risk_rating.rating_kernel import (
+    _jit_first_matching_rating,
+    first_matching_rating,
+    first_matching_rating_batch,
+)
+
+EXPECTED_SAMPLE_RESULT = Path(__file__).resolve().parent / "data" / "sample_notes_expected.json"
+
+
+def random_kernel_inputs(compiled, count, seed=0):
+    """Kernel inputs around the fully-compliant document, so every rating gets hit."""
+    rng = random.Random(seed)
+    controls_mask = compiled.all_controls_mask
+    info_tech_mask = (1 << len(compiled.info_tech_required)) - 1
+
+    def drop_bits(mask, rate):
+        for bit in range(mask.bit_length()):
+            if rng.random() < rate:
+                mask &= ~(1 << bit)
+        return mask
+
+    for _ in range(count):
+        rate = rng.choice((0.0, 0.02, 0.1, 0.3))
+        yield (
+            drop_bits(controls_mask, rate),
+            drop_bits(controls_mask, rate),
+            drop_bits(info_tech_mask, rate),
+            rng.randint(0, len(compiled.incident_elements)),
+            rng.random() < 0.5,
+            rng.random() < 0.5,
+            rng.random() < 0.5,
+            rng.random() < 0.8,
+        )
+
+
+def test_sample_notes_result(evaluator, sample_notes):
+    expected = json.loads(EXPECTED_SAMPLE_RESULT.read_text(encoding="utf-8"))
+    assert evaluator.evaluate(sample_notes) == expected
+
+
+def test_substring_fallback_matches_automaton(rules, sample_documents, monkeypatch):
+    pytest.importorskip("ahocorasick")
+    with_automaton = RiskRatingEvaluator(rules)
+    monkeypatch.setattr(matching, "ahocorasick", None)
+    fallback = RiskRatingEvaluator(rules)
+    assert isinstance(fallback.compiled.matcher.scan("x" * 1000), matching._LazyStatementMatches)
+
+    statement_ids = list(with_automaton.compiled.matcher.ids.values())
+    for notes in sample_documents:
+        normalized = _normalize(notes)
+        expected = with_automaton.compiled.matcher.scan(normalized)
+        found = fallback.compiled.matcher.scan(normalized)
+        assert [i in found for i in statement_ids] == [i in expected for i in statement_ids]
+        assert fallback.evaluate(notes) == with_automaton.evaluate(notes)
+
+
+def test_jit_kernel_matches_pure_python(evaluator):
+    pytest.importorskip("numba")
+    kernel = _jit_first_matching_rating()
+    table = evaluator.compiled.rating_table
+    ratings = set()
+    for inputs in random_kernel_inputs(evaluator.compiled, 2000):
+        expected = first_matching_rating(table.rows, table.pii_mask, *inputs)
+        assert kernel(table._array, table.pii_mask, *inputs) == expected
+        ratings.add(expected)
+    assert ratings == {-1, *range(len(table.rows))}
+
+
+def test_vectorized_kernel_matches_pure_python(evaluator):
+    np = pytest.importorskip("numpy")
+    table = evaluator.compiled.rating_table
+    documents = list(random_kernel_inputs(evaluator.compiled, 2000))
+    matrix = np.array(documents, dtype=np.int64)
+    matches = first_matching_rating_batch(table._array, table.pii_mask, matrix)
+    assert matches.tolist() == [
+        first_matching_rating(table.rows, table.pii_mask, *inputs) for inputs in documents
+    ]